@@ -28,6 +28,7 @@ from uuid import uuid4
 from pydantic import BaseModel
 
 from agno.agent.metrics import SessionMetrics
+from agno.cache.base import ResponseCache
 from agno.exceptions import ModelProviderError, StopAgentRun
 from agno.knowledge.agent import AgentKnowledge
 from agno.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageArtifact, Video, VideoArtifact
@@ -266,6 +267,9 @@ class Agent:
     delay_between_retries: int = 1
     # Exponential backoff: if True, the delay between retries is doubled each time
     exponential_backoff: bool = False
+    # Cache the raw Model responses, keyed by model, messages, tools and response format
+    # Only non-streaming runs that do not call tools are cached
+    response_cache: Optional[ResponseCache] = None
 
     # --- Agent Response Model Settings ---
     # Provide a response model to get the response as a Pydantic model
@@ -285,6 +289,9 @@ class Agent:
     structured_outputs: Optional[bool] = None
     # If `response_model` is set, sets the response mode of the model, i.e. if the model should explicitly respond with a JSON object instead of a Pydantic model
     use_json_mode: bool = False
+    # If True, trust well-formed JSON from the Model and build the response_model without validation
+    # This skips type coercion and leaves nested models as dicts
+    trust_output: bool = False
     # Save the response to a file
     save_response_to_file: Optional[str] = None
 
@@ -414,6 +421,7 @@ class Agent:
         retries: int = 0,
         delay_between_retries: int = 1,
         exponential_backoff: bool = False,
+        response_cache: Optional[ResponseCache] = None,
         parser_model: Optional[Model] = None,
         parser_model_prompt: Optional[str] = None,
         response_model: Optional[Type[BaseModel]] = None,
@@ -422,6 +430,7 @@ class Agent:
         output_model_prompt: Optional[str] = None,
         structured_outputs: Optional[bool] = None,
         use_json_mode: bool = False,
+        trust_output: bool = False,
         save_response_to_file: Optional[str] = None,
         stream: Optional[bool] = None,
         stream_intermediate_steps: bool = False,
@@ -519,6 +528,7 @@ class Agent:
         self.retries = retries
         self.delay_between_retries = delay_between_retries
         self.exponential_backoff = exponential_backoff
+        self.response_cache = response_cache
         self.parser_model = parser_model
         self.parser_model_prompt = parser_model_prompt
         self.response_model = response_model
@@ -529,6 +539,7 @@ class Agent:
         self.structured_outputs = structured_outputs
 
         self.use_json_mode = use_json_mode
+        self.trust_output = trust_output
         self.save_response_to_file = save_response_to_file
 
         self.stream = stream
@@ -582,6 +593,10 @@ class Agent:
 
         self._memory_deepcopy_done: bool = False
 
+        # Schema and prompt derived from the response_model, rebuilt only when response_model changes
+        self._response_model_cache_owner: Optional[Type[BaseModel]] = None
+        self._response_model_cache: Dict[str, Any] = {}
+
     def set_agent_id(self) -> str:
         if self.agent_id is None:
             self.agent_id = str(uuid4())
@@ -791,14 +806,22 @@ class Agent:
 
         # 2. Generate a response from the Model (includes running function calls)
         self.model = cast(Model, self.model)
-        model_response: ModelResponse = self.model.response(
-            messages=run_messages.messages,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-            response_format=response_format,
+        cache_key = self._get_response_cache_key(run_messages=run_messages, response_format=response_format)
+        cached_model_response = self._get_cached_model_response(
+            cache_key=cache_key, run_messages=run_messages, response_format=response_format
         )
+        if cached_model_response is not None:
+            model_response = cached_model_response
+        else:
+            model_response = self.model.response(
+                messages=run_messages.messages,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+                response_format=response_format,
+            )
+            self._cache_model_response(cache_key=cache_key, model_response=model_response)
         # If an output model is provided, generate output using the output model
         self._generate_response_with_output_model(model_response, run_messages)
 
@@ -1232,14 +1255,22 @@ class Agent:
         index_of_last_user_message = len(run_messages.messages)
 
         # 2. Generate a response from the Model (includes running function calls)
-        model_response: ModelResponse = await self.model.aresponse(
-            messages=run_messages.messages,
-            tools=self._tools_for_model,
-            functions=self._functions_for_model,
-            tool_choice=self.tool_choice,
-            tool_call_limit=self.tool_call_limit,
-            response_format=response_format,
+        cache_key = self._get_response_cache_key(run_messages=run_messages, response_format=response_format)
+        cached_model_response = await self._aget_cached_model_response(
+            cache_key=cache_key, run_messages=run_messages, response_format=response_format
         )
+        if cached_model_response is not None:
+            model_response = cached_model_response
+        else:
+            model_response = await self.model.aresponse(
+                messages=run_messages.messages,
+                tools=self._tools_for_model,
+                functions=self._functions_for_model,
+                tool_choice=self.tool_choice,
+                tool_call_limit=self.tool_call_limit,
+                response_format=response_format,
+            )
+            await self._acache_model_response(cache_key=cache_key, model_response=model_response)
 
         # If an output model is provided, generate output using the output model
         await self._agenerate_response_with_output_model(model_response=model_response, run_messages=run_messages)
@@ -2483,12 +2514,184 @@ class Agent:
 
         log_debug(f"Agent Run Paused: {run_response.run_id}", center=True, symbol="*")
 
+    def _get_response_cache_key(
+        self, run_messages: RunMessages, response_format: Optional[Union[Dict, Type[BaseModel]]] = None
+    ) -> Optional[str]:
+        """Build the response cache key from the model settings, the messages, the tools and the response format.
+
+        Returns None (no caching) when any message carries media, since media is not fully captured by Message.to_dict().
+        """
+        if self.response_cache is None or self.model is None:
+            return None
+
+        import json
+        from dataclasses import fields
+        from hashlib import blake2b
+
+        for message in run_messages.messages:
+            if (
+                message.images
+                or message.audio
+                or message.videos
+                or message.files
+                or message.audio_output is not None
+                or message.image_output is not None
+            ):
+                log_debug("Skipping response cache for messages with media")
+                return None
+
+        # Model settings (temperature, request_params, ...) change the response, so they are part of the key.
+        # Values that are not plain data (e.g. API clients, created lazily) are left out.
+        model_key: Dict[str, Any] = {"class": type(self.model).__qualname__}
+        for model_field in fields(self.model):
+            if model_field.name.startswith("_"):
+                continue
+            value = getattr(self.model, model_field.name)
+            try:
+                model_key[model_field.name] = json.dumps(value, sort_keys=True)
+            except (TypeError, ValueError):
+                continue
+
+        if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            response_format_key: Any = {response_format.__name__: self._get_response_model_json_schema()}
+        else:
+            response_format_key = response_format
+
+        messages_key = []
+        for message in run_messages.messages:
+            message_dict = message.to_dict()
+            message_dict.pop("metrics", None)
+            message_dict.pop("created_at", None)
+            messages_key.append(message_dict)
+
+        key_data = {
+            "model": model_key,
+            "messages": messages_key,
+            "tools": self._tools_for_model,
+            "response_format": response_format_key,
+        }
+        key_str = json.dumps(key_data, sort_keys=True, default=str)
+        return blake2b(key_str.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_cached_model_response(
+        self,
+        cache_key: Optional[str],
+        run_messages: RunMessages,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    ) -> Optional[ModelResponse]:
+        """Return a ModelResponse rebuilt from the response cache, or None on a cache miss."""
+        if self.response_cache is None or cache_key is None:
+            return None
+
+        try:
+            cached_content = self.response_cache.get(cache_key)
+        except Exception as e:
+            log_warning(f"Error reading response cache: {e}")
+            return None
+
+        return self._build_cached_model_response(
+            cache_key=cache_key,
+            cached_content=cached_content,
+            run_messages=run_messages,
+            response_format=response_format,
+        )
+
+    async def _aget_cached_model_response(
+        self,
+        cache_key: Optional[str],
+        run_messages: RunMessages,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    ) -> Optional[ModelResponse]:
+        """Return a ModelResponse rebuilt from the response cache, or None on a cache miss."""
+        if self.response_cache is None or cache_key is None:
+            return None
+
+        try:
+            cached_content = await self.response_cache.aget(cache_key)
+        except Exception as e:
+            log_warning(f"Error reading response cache: {e}")
+            return None
+
+        return self._build_cached_model_response(
+            cache_key=cache_key,
+            cached_content=cached_content,
+            run_messages=run_messages,
+            response_format=response_format,
+        )
+
+    def _build_cached_model_response(
+        self,
+        cache_key: str,
+        cached_content: Optional[str],
+        run_messages: RunMessages,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    ) -> Optional[ModelResponse]:
+        """Rebuild a ModelResponse from cached content and add the assistant message to the run messages."""
+        if cached_content is None:
+            return None
+
+        model_response = ModelResponse(role="assistant", content=cached_content)
+        if (
+            self._model_should_return_structured_output()
+            and isinstance(response_format, type)
+            and issubclass(response_format, BaseModel)
+        ):
+            try:
+                model_response.parsed = response_format.model_validate_json(cached_content)
+            except Exception as e:
+                log_warning(f"Failed to validate cached response: {e}")
+                return None
+
+        log_debug(f"Response cache hit: {cache_key}")
+        self.model = cast(Model, self.model)
+        run_messages.messages.append(Message(role=self.model.assistant_message_role, content=cached_content))
+        return model_response
+
+    def _should_cache_model_response(self, cache_key: Optional[str], model_response: ModelResponse) -> bool:
+        """Check whether a ModelResponse can be stored in and replayed from the response cache."""
+        if self.response_cache is None or cache_key is None:
+            return False
+        # Skip responses that involved tool calls, non-text output, thinking or citations,
+        # only the text content is cached so they cannot be replayed
+        return not (
+            not isinstance(model_response.content, str)
+            or model_response.tool_executions
+            or model_response.audio is not None
+            or model_response.image is not None
+            or model_response.thinking is not None
+            or model_response.redacted_thinking is not None
+            or model_response.reasoning_content is not None
+            or model_response.citations is not None
+        )
+
+    def _cache_model_response(self, cache_key: Optional[str], model_response: ModelResponse) -> None:
+        """Store the raw content of a ModelResponse in the response cache."""
+        if not self._should_cache_model_response(cache_key=cache_key, model_response=model_response):
+            return
+
+        try:
+            self.response_cache.set(cache_key, model_response.content)  # type: ignore
+        except Exception as e:
+            log_warning(f"Error writing response cache: {e}")
+
+    async def _acache_model_response(self, cache_key: Optional[str], model_response: ModelResponse) -> None:
+        """Store the raw content of a ModelResponse in the response cache."""
+        if not self._should_cache_model_response(cache_key=cache_key, model_response=model_response):
+            return
+
+        try:
+            await self.response_cache.aset(cache_key, model_response.content)  # type: ignore
+        except Exception as e:
+            log_warning(f"Error writing response cache: {e}")
+
     def _convert_response_to_structured_format(self, run_response: Union[RunResponse, ModelResponse]):
         # Convert the response to the structured format if needed
         if self.response_model is not None and not isinstance(run_response.content, self.response_model):
             if isinstance(run_response.content, str) and self.parse_response:
                 try:
-                    structured_output = parse_response_model_str(run_response.content, self.response_model)
+                    structured_output = parse_response_model_str(
+                        run_response.content, self.response_model, trust=self.trust_output
+                    )
 
                     # Update RunResponse
                     if structured_output is not None:
@@ -3865,7 +4068,7 @@ class Agent:
                         "type": "json_schema",
                         "json_schema": {
                             "name": self.response_model.__name__,
-                            "schema": self.response_model.model_json_schema(),
+                            "schema": self._get_response_model_json_schema(),
                         },
                     }
                 else:
@@ -3875,6 +4078,27 @@ class Agent:
                 log_debug("Model does not support structured or JSON schema outputs.")
                 return json_response_format
 
+    def _get_response_model_cache(self) -> Dict[str, Any]:
+        """Return the cache of values derived from the response_model, resetting it if response_model changed."""
+        if self._response_model_cache_owner is not self.response_model:
+            self._response_model_cache_owner = self.response_model
+            self._response_model_cache = {}
+        return self._response_model_cache
+
+    def _get_response_model_json_schema(self) -> Dict[str, Any]:
+        """Return the JSON schema of the response_model, building it once per response_model."""
+        response_model_cache = self._get_response_model_cache()
+        if "json_schema" not in response_model_cache:
+            response_model_cache["json_schema"] = self.response_model.model_json_schema()  # type: ignore
+        return response_model_cache["json_schema"]
+
+    def _get_json_output_prompt(self) -> str:
+        """Return the JSON output prompt for the response_model, building it once per response_model."""
+        response_model_cache = self._get_response_model_cache()
+        if "json_output_prompt" not in response_model_cache:
+            response_model_cache["json_output_prompt"] = get_json_output_prompt(self.response_model)  # type: ignore
+        return response_model_cache["json_output_prompt"]
+
     def resolve_run_context(self) -> None:
         from inspect import signature
 
@@ -4434,7 +4658,7 @@ class Agent:
                     and (not self.use_json_mode or self.structured_outputs is True)
                 )
             ):
-                sys_message_content += f"\n{get_json_output_prompt(self.response_model)}"  # type: ignore
+                sys_message_content += f"\n{self._get_json_output_prompt()}"
 
             # type: ignore
             return Message(role=self.system_message_role, content=sys_message_content)
@@ -4697,7 +4921,7 @@ class Agent:
                 and (not self.use_json_mode or self.structured_outputs is True)
             )
         ):
-            system_message_content += f"{get_json_output_prompt(self.response_model)}"  # type: ignore
+            system_message_content += f"{self._get_json_output_prompt()}"
 
         # 3.3.14 Add the response model format prompt if response_model is provided
         if self.response_model is not None and self.parser_model is not None:
@@ -5079,7 +5303,7 @@ class Agent:
         )
 
         if response_format == {"type": "json_object"} and self.response_model is not None:
-            system_content += f"{get_json_output_prompt(self.response_model)}"  # type: ignore
+            system_content += f"{self._get_json_output_prompt()}"
 
         return [
             Message(role="system", content=system_content),
@@ -5097,7 +5321,7 @@ class Agent:
         )
 
         if response_format == {"type": "json_object"} and self.response_model is not None:
-            system_content += f"{get_json_output_prompt(self.response_model)}"  # type: ignore
+            system_content += f"{self._get_json_output_prompt()}"
 
         return [
             Message(role="system", content=system_content),
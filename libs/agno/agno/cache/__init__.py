@@ -0,0 +1,7 @@
+from agno.cache.base import ResponseCache
+from agno.cache.in_memory import InMemoryResponseCache
+
+__all__ = [
+    "ResponseCache",
+    "InMemoryResponseCache",
+]
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ResponseCache(ABC):
+    """Base class for caching raw model responses, keyed by a digest of the request"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    async def aget(self, key: str) -> Optional[str]:
+        """Async get. Defaults to the sync implementation, override for backends that do network I/O."""
+        return self.get(key)
+
+    async def aset(self, key: str, value: str) -> None:
+        """Async set. Defaults to the sync implementation, override for backends that do network I/O."""
+        self.set(key, value)
@@ -0,0 +1,44 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple
+
+from agno.cache.base import ResponseCache
+
+
+class InMemoryResponseCache(ResponseCache):
+    def __init__(self, max_size: int = 1024, ttl: Optional[int] = None):
+        """
+        Initialize an in-memory LRU cache for model responses.
+
+        Args:
+            max_size (int): Maximum number of responses to keep. The least recently used entry is evicted first.
+            ttl (Optional[int]): Time to live in seconds for each entry. None means entries never expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created_at, value = entry
+            if self.ttl is not None and time.time() - created_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,71 @@
+from typing import Optional
+
+from agno.cache.base import ResponseCache
+
+try:
+    from redis import Redis
+    from redis.asyncio import Redis as AsyncRedis
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+
+class RedisResponseCache(ResponseCache):
+    def __init__(
+        self,
+        prefix: str = "agno_response_cache",
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        ssl: Optional[bool] = False,
+        expire: Optional[int] = None,
+    ):
+        """
+        Initialize a Redis-backed cache for model responses.
+
+        Args:
+            prefix (str): Prefix for Redis keys to namespace the cached responses
+            host (str): Redis host address
+            port (int): Redis port number
+            db (int): Redis database number
+            password (Optional[str]): Redis password if authentication is required
+            ssl (Optional[bool]): Whether to use SSL for Redis connection
+            expire (Optional[int]): TTL (time to live) in seconds for Redis keys. None means no expiration.
+        """
+        self.prefix = prefix
+        self.expire = expire
+        self.redis_client = Redis(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=True,
+            ssl=ssl,
+        )
+        self.async_redis_client = AsyncRedis(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=True,
+            ssl=ssl,
+        )
+
+    def _get_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[str]:
+        return self.redis_client.get(self._get_key(key))
+
+    def set(self, key: str, value: str) -> None:
+        self.redis_client.set(self._get_key(key), value, ex=self.expire)
+
+    def clear(self) -> None:
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+            self.redis_client.delete(key)
+
+    async def aget(self, key: str) -> Optional[str]:
+        return await self.async_redis_client.get(self._get_key(key))
+
+    async def aset(self, key: str, value: str) -> None:
+        await self.async_redis_client.set(self._get_key(key), value, ex=self.expire)
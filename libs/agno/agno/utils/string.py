@@ -1,12 +1,60 @@
+import functools
 import hashlib
 import json
 import re
-from typing import Optional, Type
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
 from agno.utils.log import logger
 
+T = TypeVar("T")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Patterns used by url_safe_string
+_CAMEL_CASE_BOUNDARY_PATTERN = re.compile(r"([a-z0-9])([A-Z])")
+_URL_UNSAFE_CHARS_PATTERN = re.compile(r"[^\w\-.]")
+_CONSECUTIVE_DASHES_PATTERN = re.compile(r"-+")
+
+# Matches keys wrapped in markdown formatting, e.g. *"name"* or `"name"`
+_MARKDOWN_KEY_PATTERN = re.compile(r'[*`#]?"([A-Za-z0-9_]+)"[*`#]?')
+
+# Matches a key and its string value up to the closing quote that precedes a comma or closing brace
+_KEY_VALUE_PATTERN = re.compile(r'"(?P<key>[^"]+)"\s*:\s*"(?P<value>.*?)(?="\s*(?:,|\}))')
+
+# Results of the repair path in parse_response_model_str, keyed by (response_model, content digest).
+# Keys hold strong references to the response_model classes, so dynamically created models
+# stay alive until their entries are evicted (at most _PARSE_CACHE_MAX_SIZE of them).
+_PARSE_CACHE: "OrderedDict[Tuple[Type[BaseModel], bytes], Optional[BaseModel]]" = OrderedDict()
+_PARSE_CACHE_MAX_SIZE = 1024
+_PARSE_CACHE_LOCK = Lock()
+
+# Number tokens long enough to overflow a 64-bit integer, which orjson cannot decode exactly
+_LONG_INTEGER_PATTERN = re.compile(r"[:\[,]\s*-?\d{19,}")
+
+# Newlines become spaces, all other control characters (and DEL) are dropped
+_CONTROL_CHARS_TABLE = {**dict.fromkeys(range(0x20)), 0x7F: None, ord("\n"): " "}
+
+
+def _json_loads(content: str):
+    """Decode JSON with orjson when available, falling back to the standard library.
+
+    orjson rejects NaN/Infinity and either rejects or rounds integers wider than 64 bits, all of which the
+    standard library handles, so those inputs go through json.loads.
+    """
+    if orjson is not None and not _LONG_INTEGER_PATTERN.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
 
 def is_valid_uuid(uuid_str: str) -> bool:
     """
@@ -41,21 +89,22 @@ def safe_content_hash(content: str) -> str:
     return content_hash
 
 
+@functools.lru_cache(maxsize=1024)
 def url_safe_string(input_string):
     # Replace spaces with dashes
     safe_string = input_string.replace(" ", "-")
 
     # Convert camelCase to kebab-case
-    safe_string = re.sub(r"([a-z0-9])([A-Z])", r"\1-\2", safe_string).lower()
+    safe_string = _CAMEL_CASE_BOUNDARY_PATTERN.sub(r"\1-\2", safe_string).lower()
 
     # Convert snake_case to kebab-case
     safe_string = safe_string.replace("_", "-")
 
     # Remove special characters, keeping alphanumeric, dashes, and dots
-    safe_string = re.sub(r"[^\w\-.]", "", safe_string)
+    safe_string = _URL_UNSAFE_CHARS_PATTERN.sub("", safe_string)
 
     # Ensure no consecutive dashes
-    safe_string = re.sub(r"-+", "-", safe_string)
+    safe_string = _CONSECUTIVE_DASHES_PATTERN.sub("-", safe_string)
 
     return safe_string
 
@@ -93,39 +142,45 @@ def _extract_json_objects(text: str) -> list[str]:
     return objs
 
 
-def _clean_json_content(content: str) -> str:
-    """Clean and prepare JSON content for parsing."""
+def _escape_quotes_in_values(match: re.Match) -> str:
+    """Escape quotes only in values, not keys."""
+    key = match.group(1)
+    value = match.group(2)
+
+    if '\\"' in value:
+        unescaped_value = value.replace('\\"', '"')
+        escaped_value = unescaped_value.replace('"', '\\"')
+    else:
+        escaped_value = value.replace('"', '\\"')
+
+    return f'"{key}": "{escaped_value}'
+
+
+def _strip_json_formatting(content: str) -> str:
+    """Strip code fences, markdown formatting around keys and control characters from JSON content."""
     # Handle code blocks
     if "```json" in content:
-        content = content.split("```json")[-1].strip()
-        parts = content.split("```")
-        parts.pop(-1)
-        content = "".join(parts)
+        # Keep everything between the last ```json and the final closing fence, dropping any inner fences
+        content = content.rpartition("```json")[2].strip()
+        content = "".join(content.split("```")[:-1])
     elif "```" in content:
-        content = content.split("```")[1].strip()
+        content = content.partition("```")[2].partition("```")[0].strip()
 
     # Replace markdown formatting like *"name"* or `"name"` with "name"
-    content = re.sub(r'[*`#]?"([A-Za-z0-9_]+)"[*`#]?', r'"\1"', content)
+    content = _MARKDOWN_KEY_PATTERN.sub(r'"\1"', content)
 
-    # Handle newlines and control characters
-    content = content.replace("\n", " ").replace("\r", "")
-    content = re.sub(r"[\x00-\x1F\x7F]", "", content)
+    # Handle newlines and control characters in a single pass
+    content = content.translate(_CONTROL_CHARS_TABLE)
 
-    # Escape quotes only in values, not keys
-    def escape_quotes_in_values(match):
-        key = match.group(1)
-        value = match.group(2)
+    return content
 
-        if '\\"' in value:
-            unescaped_value = value.replace('\\"', '"')
-            escaped_value = unescaped_value.replace('"', '\\"')
-        else:
-            escaped_value = value.replace('"', '\\"')
 
-        return f'"{key}": "{escaped_value}'
+def _clean_json_content(content: str) -> str:
+    """Clean and prepare JSON content for parsing."""
+    content = _strip_json_formatting(content)
 
     # Find and escape quotes in field values
-    content = re.sub(r'"(?P<key>[^"]+)"\s*:\s*"(?P<value>.*?)(?="\s*(?:,|\}))', escape_quotes_in_values, content)
+    content = _KEY_VALUE_PATTERN.sub(_escape_quotes_in_values, content)
 
     return content
 
@@ -140,7 +195,7 @@ def _parse_individual_json(content: str, response_model: Type[BaseModel]) -> Opt
 
     for candidate in candidate_jsons:
         try:
-            candidate_obj = json.loads(candidate)
+            candidate_obj = _json_loads(candidate)
         except json.JSONDecodeError:
             continue
 
@@ -167,38 +222,148 @@ def _parse_individual_json(content: str, response_model: Type[BaseModel]) -> Opt
         return None
 
 
-def parse_response_model_str(content: str, response_model: Type[BaseModel]) -> Optional[BaseModel]:
+def _construct_trusted_response_model(content: str, response_model: Type[BaseModel]) -> Optional[BaseModel]:
+    """Build the response model without validation if content is a JSON object with all required fields."""
+    try:
+        data = _json_loads(content)
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    if not all(name in data for name, field in response_model.model_fields.items() if field.is_required()):
+        return None
+
+    return response_model.model_construct(**data)
+
+
+def _repair_and_parse_response_model_str(content: str, response_model: Type[BaseModel]) -> Optional[BaseModel]:
+    """Clean up malformed content and parse it into the response model, trying progressively looser strategies."""
     structured_output = None
 
-    # Clean content first to simplify all parsing attempts
-    cleaned_content = _clean_json_content(content)
+    # Fenced or markdown-formatted JSON is often valid once the formatting is stripped,
+    # in which case the quote repair pass can be skipped
+    formatted_content = _strip_json_formatting(content)
+    try:
+        return response_model.model_validate_json(formatted_content)
+    except ValidationError:
+        pass
+
+    # Find and escape quotes in field values to simplify all remaining parsing attempts
+    cleaned_content = _KEY_VALUE_PATTERN.sub(_escape_quotes_in_values, formatted_content)
 
     try:
         # First attempt: direct JSON validation on cleaned content
         structured_output = response_model.model_validate_json(cleaned_content)
-    except (ValidationError, json.JSONDecodeError):
-        try:
-            # Second attempt: Parse as Python dict
-            data = json.loads(cleaned_content)
-            structured_output = response_model.model_validate(data)
-        except (ValidationError, json.JSONDecodeError) as e:
-            logger.warning(f"Failed to parse cleaned JSON: {e}")
-
-            # Third attempt: Extract individual JSON objects
-            candidate_jsons = _extract_json_objects(cleaned_content)
-
-            if len(candidate_jsons) == 1:
-                # Single JSON object - try to parse it directly
-                try:
-                    data = json.loads(candidate_jsons[0])
-                    structured_output = response_model.model_validate(data)
-                except (ValidationError, json.JSONDecodeError):
-                    pass
+    except ValidationError as e:
+        logger.warning(f"Failed to parse cleaned JSON: {e}")
+
+        # Second attempt: Extract individual JSON objects
+        candidate_jsons = _extract_json_objects(cleaned_content)
+
+        if len(candidate_jsons) == 1:
+            # Single JSON object - validate it directly
+            try:
+                structured_output = response_model.model_validate_json(candidate_jsons[0])
+            except ValidationError:
+                pass
 
+        if structured_output is None:
+            # Final attempt: Handle concatenated JSON objects with field merging
+            structured_output = _parse_individual_json(cleaned_content, response_model)
             if structured_output is None:
-                # Final attempt: Handle concatenated JSON objects with field merging
-                structured_output = _parse_individual_json(cleaned_content, response_model)
-                if structured_output is None:
-                    logger.warning("All parsing attempts failed.")
+                logger.warning("All parsing attempts failed.")
 
     return structured_output
+
+
+def _copy_parsed_response_model(structured_output: BaseModel) -> BaseModel:
+    """Return a deep copy of a cached parse result, frozen models can still hold mutable fields."""
+    return structured_output.model_copy(deep=True)
+
+
+def parse_response_model_str(content: str, response_model: Type[BaseModel], trust: bool = False) -> Optional[BaseModel]:
+    """
+    Parse a model response string into the given response model.
+
+    Args:
+        content: The response content to parse
+        response_model: The Pydantic model to parse into
+        trust: If True, well-formed JSON objects containing all required fields are built with
+            model_construct, skipping validation and type coercion. Nested models are left as dicts.
+
+    Returns:
+        Optional[BaseModel]: The parsed response model, or None if parsing failed
+    """
+    structured_output = None
+
+    if trust:
+        structured_output = _construct_trusted_response_model(content, response_model)
+        if structured_output is not None:
+            return structured_output
+
+    # Fast path: well-formed JSON that matches the schema needs no cleanup
+    try:
+        return response_model.model_validate_json(content)
+    except ValidationError:
+        pass
+
+    # Repairing malformed content is expensive, reuse the result for content seen before
+    cache_key = (response_model, hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+    with _PARSE_CACHE_LOCK:
+        if cache_key in _PARSE_CACHE:
+            _PARSE_CACHE.move_to_end(cache_key)
+            cached_output = _PARSE_CACHE[cache_key]
+            return _copy_parsed_response_model(cached_output) if cached_output is not None else None
+
+    structured_output = _repair_and_parse_response_model_str(content, response_model)
+
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[cache_key] = structured_output
+        while len(_PARSE_CACHE) > _PARSE_CACHE_MAX_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+
+    return _copy_parsed_response_model(structured_output) if structured_output is not None else None
+
+
+def parse_response_model_str_msgspec(content: str, struct_cls: Type[T]) -> Optional[T]:
+    """
+    Parse a model response string into a msgspec Struct.
+
+    msgspec decodes and validates in a single pass without building an intermediate dict,
+    which suits high-throughput agents that can define their output as a msgspec.Struct.
+
+    Args:
+        content: The response content to parse
+        struct_cls: The msgspec Struct (or any type msgspec can decode into) to parse into
+
+    Returns:
+        Optional[T]: The decoded struct, or None if parsing failed
+    """
+    try:
+        import msgspec
+    except ImportError:
+        raise ImportError("`msgspec` not installed. Please install using `pip install msgspec`")
+
+    # Fast path: well-formed JSON that matches the type needs no cleanup
+    try:
+        return msgspec.json.decode(content, type=struct_cls)
+    except msgspec.MsgspecError:
+        pass
+
+    cleaned_content = _clean_json_content(content)
+    try:
+        return msgspec.json.decode(cleaned_content, type=struct_cls)
+    except msgspec.MsgspecError as e:
+        logger.warning(f"Failed to parse cleaned JSON: {e}")
+
+    # Fall back to the single embedded JSON object, if there is exactly one
+    candidate_jsons = _extract_json_objects(cleaned_content)
+    if len(candidate_jsons) == 1:
+        try:
+            return msgspec.json.decode(candidate_jsons[0], type=struct_cls)
+        except msgspec.MsgspecError:
+            pass
+
+    logger.warning("All parsing attempts failed.")
+    return None
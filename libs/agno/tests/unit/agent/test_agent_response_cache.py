@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from agno.agent import Agent
+from agno.cache import InMemoryResponseCache
+from agno.media import Audio, File
+from agno.models.base import Model
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class CountingModel(Model):
+    """Model that returns a fixed response and counts how often it is invoked"""
+
+    id: str = "counting-model"
+    name: str = "CountingModel"
+    provider: str = "Test"
+    response_content: str = '{"name": "test", "value": "123"}'
+    response_thinking: Optional[str] = None
+    temperature: Optional[float] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        # Kept off the dataclass fields so it does not change the response cache key
+        self.invoke_count = 0
+
+    def invoke(self, *args, **kwargs) -> Any:
+        self.invoke_count += 1
+        return self.response_content
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        self.invoke_count += 1
+        return self.response_content
+
+    def invoke_stream(self, *args, **kwargs):
+        yield self.response_content
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        yield self.response_content
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response, thinking=self.response_thinking)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+
+class ResponseModel(BaseModel):
+    name: str
+    value: str
+
+
+def test_response_cache_skips_model_on_identical_run():
+    """Test that an identical run is served from the response cache"""
+    model = CountingModel()
+    agent = Agent(model=model, response_model=ResponseModel, response_cache=InMemoryResponseCache())
+
+    first = agent.run("Give me a record")
+    second = agent.run("Give me a record")
+
+    assert model.invoke_count == 1
+    assert isinstance(second.content, ResponseModel)
+    assert second.content == first.content
+    assert second.messages[-1].role == "assistant"
+    assert second.messages[-1].content == model.response_content
+
+
+def test_response_cache_misses_on_different_prompt():
+    """Test that a different prompt is not served from the response cache"""
+    model = CountingModel()
+    agent = Agent(model=model, response_model=ResponseModel, response_cache=InMemoryResponseCache())
+
+    agent.run("Give me a record")
+    agent.run("Give me another record")
+
+    assert model.invoke_count == 2
+
+
+def test_response_cache_skips_runs_with_media():
+    """Test that runs with files or audio are never served from the response cache"""
+    model = CountingModel()
+    agent = Agent(model=model, response_cache=InMemoryResponseCache())
+
+    agent.run("Summarize this file", files=[File(url="https://example.com/a.pdf")])
+    agent.run("Summarize this file", files=[File(url="https://example.com/b.pdf")])
+    assert model.invoke_count == 2
+
+    agent.run("Transcribe this", audio=[Audio(url="https://example.com/a.mp3")])
+    agent.run("Transcribe this", audio=[Audio(url="https://example.com/b.mp3")])
+    assert model.invoke_count == 4
+
+
+def test_response_cache_keys_on_model_settings():
+    """Test that agents sharing a cache with differently configured models do not share responses"""
+    cache = InMemoryResponseCache()
+    cold_model = CountingModel(temperature=0.0)
+    hot_model = CountingModel(temperature=1.0, response_content='{"name": "hot", "value": "456"}')
+
+    cold = Agent(model=cold_model, response_model=ResponseModel, response_cache=cache).run("Give me a record")
+    hot = Agent(model=hot_model, response_model=ResponseModel, response_cache=cache).run("Give me a record")
+
+    assert cold_model.invoke_count == 1
+    assert hot_model.invoke_count == 1
+    assert cold.content.name == "test"
+    assert hot.content.name == "hot"
+
+
+def test_response_cache_skips_responses_with_thinking():
+    """Test that responses with thinking are not cached, since only the text content would be replayed"""
+    model = CountingModel(response_thinking="Let me think")
+    agent = Agent(model=model, response_cache=InMemoryResponseCache())
+
+    first = agent.run("Give me a record")
+    second = agent.run("Give me a record")
+
+    assert model.invoke_count == 2
+    assert first.thinking == "Let me think"
+    assert second.thinking == "Let me think"
+
+
+def test_in_memory_response_cache_evicts_least_recently_used():
+    """Test that the in-memory response cache evicts the least recently used entry"""
+    cache = InMemoryResponseCache(max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+@pytest.mark.asyncio
+async def test_response_cache_arun_uses_async_cache_methods():
+    """Test that arun reads and writes the response cache through the async methods"""
+    model = CountingModel()
+    cache = InMemoryResponseCache()
+    agent = Agent(model=model, response_cache=cache)
+
+    with (
+        patch.object(cache, "aget", wraps=cache.aget) as mock_aget,
+        patch.object(cache, "aset", wraps=cache.aset) as mock_aset,
+    ):
+        await agent.arun("Give me a record")
+        await agent.arun("Give me a record")
+
+    assert model.invoke_count == 1
+    assert mock_aget.await_count == 2
+    assert mock_aset.await_count == 1
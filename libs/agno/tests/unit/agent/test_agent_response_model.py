@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from agno.agent import Agent
+
+
+class MovieScript(BaseModel):
+    title: str
+    genre: str
+
+
+class Dialogue(BaseModel):
+    speaker: str
+    line: str
+
+
+def test_response_model_json_schema_is_built_once():
+    """Test that the response_model JSON schema is reused across calls"""
+    agent = Agent(response_model=MovieScript)
+
+    with patch.object(MovieScript, "model_json_schema", wraps=MovieScript.model_json_schema) as mock_schema:
+        first = agent._get_response_model_json_schema()
+        second = agent._get_response_model_json_schema()
+
+    assert mock_schema.call_count == 1
+    assert first is second
+    assert set(first["properties"]) == {"title", "genre"}
+
+
+def test_json_output_prompt_is_rebuilt_when_response_model_changes():
+    """Test that the cached JSON output prompt follows changes to response_model"""
+    agent = Agent(response_model=MovieScript)
+
+    with patch("agno.agent.agent.get_json_output_prompt", return_value="prompt") as mock_prompt:
+        agent._get_json_output_prompt()
+        agent._get_json_output_prompt()
+        assert mock_prompt.call_count == 1
+
+        agent.response_model = Dialogue
+        agent._get_json_output_prompt()
+        assert mock_prompt.call_count == 2
+        mock_prompt.assert_called_with(Dialogue)
@@ -0,0 +1,78 @@
+from typing import Dict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agno.cache.redis import RedisResponseCache
+
+
+@pytest.fixture
+def mock_redis_data():
+    """In-memory store shared by the mocked sync and async Redis clients."""
+    return {}
+
+
+@pytest.fixture
+def mock_redis_client(mock_redis_data: Dict[str, str]):
+    """Mock sync Redis client backed by the in-memory store."""
+    with patch("agno.cache.redis.Redis") as mock_redis:
+        client = MagicMock()
+        client.get.side_effect = lambda key: mock_redis_data.get(key)
+        client.set.side_effect = lambda key, value, ex=None: mock_redis_data.update({key: value})
+        client.delete.side_effect = lambda key: mock_redis_data.pop(key, None)
+        client.scan_iter.side_effect = lambda match: [
+            k for k in list(mock_redis_data.keys()) if k.startswith(match.replace("*", ""))
+        ]
+        mock_redis.return_value = client
+        yield client
+
+
+@pytest.fixture
+def mock_async_redis_client(mock_redis_data: Dict[str, str]):
+    """Mock async Redis client backed by the in-memory store."""
+    with patch("agno.cache.redis.AsyncRedis") as mock_async_redis:
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=lambda key: mock_redis_data.get(key))
+        client.set = AsyncMock(side_effect=lambda key, value, ex=None: mock_redis_data.update({key: value}))
+        mock_async_redis.return_value = client
+        yield client
+
+
+@pytest.fixture
+def cache(mock_redis_client, mock_async_redis_client):
+    """Create a response cache with mock Redis clients."""
+    return RedisResponseCache(prefix="test_cache", expire=60)
+
+
+def test_get_and_set(cache, mock_redis_client):
+    """Test that values are stored under the prefixed key with the configured expiry."""
+    assert cache.get("key") is None
+
+    cache.set("key", "value")
+
+    mock_redis_client.set.assert_called_once_with("test_cache:key", "value", ex=60)
+    assert cache.get("key") == "value"
+
+
+def test_clear_only_removes_prefixed_keys(cache, mock_redis_data):
+    """Test that clear() only deletes keys under the cache prefix."""
+    cache.set("a", "1")
+    cache.set("b", "2")
+    mock_redis_data["other:c"] = "3"
+
+    cache.clear()
+
+    assert mock_redis_data == {"other:c": "3"}
+
+
+@pytest.mark.asyncio
+async def test_aget_and_aset(cache, mock_redis_client, mock_async_redis_client):
+    """Test that the async methods use the async client and share the key layout with the sync ones."""
+    assert await cache.aget("key") is None
+
+    await cache.aset("key", "value")
+
+    mock_async_redis_client.set.assert_awaited_once_with("test_cache:key", "value", ex=60)
+    mock_redis_client.set.assert_not_called()
+    assert await cache.aget("key") == "value"
+    assert cache.get("key") == "value"
@@ -1,6 +1,8 @@
 from typing import List, Optional
+from unittest.mock import patch
 
-from pydantic import BaseModel
+import pytest
+from pydantic import BaseModel, ConfigDict
 
 from agno.utils.string import parse_response_model_str, safe_content_hash, url_safe_string
 
@@ -117,6 +119,16 @@ def test_url_safe_string_complex():
     )
 
 
+def test_url_safe_string_is_memoized():
+    """Test that repeated calls with the same input are served from the cache"""
+    url_safe_string.cache_clear()
+    assert url_safe_string("My Agent_Name") == "my-agent-name"
+    assert url_safe_string("My Agent_Name") == "my-agent-name"
+    cache_info = url_safe_string.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+
 class MockModel(BaseModel):
     name: str
     value: Optional[str] = None
@@ -132,6 +144,16 @@ def test_parse_direct_json():
     assert result.value == "123"
 
 
+def test_parse_direct_json_skips_cleanup():
+    """Test that valid JSON matching the schema is returned without running the cleanup pipeline"""
+    content = '{"name": "test", "value": "line one\\nline two"}'
+    with patch("agno.utils.string._strip_json_formatting") as mock_clean:
+        result = parse_response_model_str(content, MockModel)
+    mock_clean.assert_not_called()
+    assert result is not None
+    assert result.value == "line one\nline two"
+
+
 def test_parse_already_escaped_string():
     """Test parsing a clean JSON string directly"""
     content = '{"name": "test", "value": "Already escaped "quote""}'
@@ -157,6 +179,19 @@ def test_parse_json_with_markdown_block():
     assert result.value == "123"
 
 
+def test_parse_json_with_markdown_block_skips_quote_repair():
+    """Test that fenced JSON that is valid after stripping the fence skips the quote repair pass"""
+    content = """```json
+    {"name": "test", "value": "123"}
+    ```"""
+    with patch("agno.utils.string._escape_quotes_in_values") as mock_escape:
+        result = parse_response_model_str(content, MockModel)
+    mock_escape.assert_not_called()
+    assert result is not None
+    assert result.name == "test"
+    assert result.value == "123"
+
+
 def test_parse_json_with_generic_code_block():
     """Test parsing JSON from a generic markdown code block"""
     content = """Some text before
@@ -200,6 +235,15 @@ def test_parse_json_with_quotes_in_values():
     assert result.value == 'some "quoted" value'
 
 
+def test_parse_json_with_unicode_whitespace_around_colon():
+    """Test parsing JSON with non-breaking or wide spaces around the colon"""
+    content = '{"name":\xa0"test", "value":\u3000"123"}'
+    result = parse_response_model_str(content, MockModel)
+    assert result is not None
+    assert result.name == "test"
+    assert result.value == "123"
+
+
 def test_parse_json_with_missing_required_field():
     """Test parsing JSON with missing required field"""
     content = '{"value": "123"}'  # Missing required 'name' field
@@ -207,6 +251,43 @@ def test_parse_json_with_missing_required_field():
     assert result is None
 
 
+def test_parse_json_with_wrong_field_type():
+    """Test that valid JSON not matching the schema returns None"""
+    content = '{"name": ["not", "a", "string"], "value": "123"}'
+    result = parse_response_model_str(content, MockModel)
+    assert result is None
+
+
+def test_parse_json_with_extra_keys_for_forbid_model():
+    """Test that extra keys are dropped for models that forbid extra fields"""
+
+    class StrictModel(BaseModel):
+        model_config = ConfigDict(extra="forbid")
+
+        name: str
+
+    content = '{"name": "x", "note": "extra"}'
+    result = parse_response_model_str(content, StrictModel)
+    assert result is not None
+    assert result.name == "x"
+
+    fenced_content = """```json
+    {"name": "x", "note": "extra"}
+    ```"""
+    result = parse_response_model_str(fenced_content, StrictModel)
+    assert result is not None
+    assert result.name == "x"
+
+
+def test_parse_json_object_wrapped_in_array():
+    """Test that an object wrapped in a JSON array still falls through to object extraction"""
+    content = '[{"name": "test", "value": "123"}]'
+    result = parse_response_model_str(content, MockModel)
+    assert result is not None
+    assert result.name == "test"
+    assert result.value == "123"
+
+
 def test_parse_invalid_json():
     """Test parsing invalid JSON"""
     content = '{"name": "test", value: "123"}'  # Missing quotes around value
@@ -415,3 +496,137 @@ def test_parse_json_with_python_code_in_value():
         == "def factorial(n):     # Calculate factorial of n     if n <= 1:         return 1     return n * factorial(n - 1)"
     )
     assert result.description == "A recursive factorial function with comments and multiplication"
+
+
+def test_json_loads_raises_stdlib_decode_error():
+    """Test that _json_loads surfaces json.JSONDecodeError regardless of the backend"""
+    import json
+
+    from agno.utils.string import _json_loads
+
+    assert _json_loads('{"name": "test"}') == {"name": "test"}
+    with pytest.raises(json.JSONDecodeError):
+        _json_loads('{"name": "test",}')
+
+
+def test_json_loads_accepts_stdlib_only_values():
+    """Test that _json_loads accepts NaN and big integers that orjson rejects"""
+    import math
+
+    from agno.utils.string import _json_loads
+
+    assert math.isnan(_json_loads('{"score": NaN}')["score"])
+    assert _json_loads('{"big": 123456789012345678901234567890}')["big"] == 123456789012345678901234567890
+
+
+def test_parse_concatenated_json_with_nan_and_big_int():
+    """Test that concatenated objects with NaN or big integers are still merged"""
+
+    class ScoreModel(BaseModel):
+        name: str
+        score: float
+        items: List[int]
+
+    content = 'Part 1: {"name": "a", "score": NaN} Part 2: {"items": [1, 2]}'
+    result = parse_response_model_str(content, ScoreModel)
+    assert result is not None
+    assert result.name == "a"
+    assert result.score != result.score  # NaN
+    assert result.items == [1, 2]
+
+    class BigModel(BaseModel):
+        name: str
+        big: int
+
+    content = 'Part 1: {"name": "a"} Part 2: {"big": 123456789012345678901234567890}'
+    result = parse_response_model_str(content, BigModel)
+    assert result is not None
+    assert result.big == 123456789012345678901234567890
+
+
+def test_parse_trusted_json_skips_validation():
+    """Test that trust=True builds the model without validation or type coercion"""
+
+    class CountModel(BaseModel):
+        name: str
+        count: int
+
+    content = '{"name": "test", "count": "3"}'
+    result = parse_response_model_str(content, CountModel, trust=True)
+    assert result is not None
+    assert result.name == "test"
+    # No coercion happens on the trusted path
+    assert result.count == "3"
+
+    validated = parse_response_model_str(content, CountModel)
+    assert validated is not None
+    assert validated.count == 3
+
+
+def test_parse_trusted_json_missing_required_field_is_validated():
+    """Test that trust=True still falls back to validation when required fields are missing"""
+    content = '{"value": "123"}'
+    result = parse_response_model_str(content, MockModel, trust=True)
+    assert result is None
+
+
+def test_parse_repaired_json_is_cached():
+    """Test that repeated malformed content is served from the parse cache"""
+    content = '{"name": "cached "quoted" text", "value": "123"}'
+    first = parse_response_model_str(content, MockModel)
+
+    with patch("agno.utils.string._strip_json_formatting") as mock_clean:
+        second = parse_response_model_str(content, MockModel)
+    mock_clean.assert_not_called()
+
+    assert first is not None and second is not None
+    assert second.name == 'cached "quoted" text'
+    # Cached results are copied so callers cannot mutate each other's output
+    assert second is not first
+    second.name = "changed"
+    third = parse_response_model_str(content, MockModel)
+    assert third is not None
+    assert third.name == 'cached "quoted" text'
+
+
+def test_parse_repaired_frozen_json_is_not_shared():
+    """Test that cached frozen models are still copied, since their list fields are mutable"""
+
+    class FrozenModel(BaseModel):
+        model_config = ConfigDict(frozen=True)
+
+        name: str
+        tags: List[str]
+
+    content = '{"name": "frozen "quoted" text", "tags": ["a"]}'
+    first = parse_response_model_str(content, FrozenModel)
+    assert first is not None
+    first.tags.append("b")
+
+    second = parse_response_model_str(content, FrozenModel)
+    assert second is not None
+    assert second is not first
+    assert second.tags == ["a"]
+
+
+def test_parse_msgspec_struct():
+    """Test parsing clean and markdown-wrapped JSON into a msgspec Struct"""
+    msgspec = pytest.importorskip("msgspec")
+
+    from agno.utils.string import parse_response_model_str_msgspec
+
+    class MockStruct(msgspec.Struct):
+        name: str
+        value: Optional[str] = None
+
+    result = parse_response_model_str_msgspec('{"name": "test", "value": "123"}', MockStruct)
+    assert result == MockStruct(name="test", value="123")
+
+    content = """```json
+    {"name": "test", "value": "some "quoted" value"}
+    ```"""
+    result = parse_response_model_str_msgspec(content, MockStruct)
+    assert result == MockStruct(name="test", value='some "quoted" value')
+
+    assert parse_response_model_str_msgspec('{"value": "123"}', MockStruct) is None
+    assert parse_response_model_str_msgspec("Just some regular text", MockStruct) is None